@@ -522,3 +522,52 @@ calculate_evaluation_orders(const std::vector<Adjacency>& adjacency_list,
     }
     return std::make_tuple(node_order, edge_order);
 }
+
+// Copy equally sized rows into one contiguous numpy array of shape
+// (rows, cols), so python receives a single buffer instead of nested lists.
+template <typename T, typename U>
+py::array_t<T> to_numpy(const std::vector<std::vector<U>>& rows) {
+    py::ssize_t n_rows = rows.size();
+    py::ssize_t n_cols = rows.empty() ? 0 : rows[0].size();
+    py::array_t<T> array({n_rows, n_cols});
+    auto buf = array.template mutable_unchecked<2>();
+    for (py::ssize_t i = 0; i < n_rows; i++) {
+        assertm((py::ssize_t)rows[i].size() == n_cols, "Ragged rows");
+        for (py::ssize_t j = 0; j < n_cols; j++) {
+            buf(i, j) = rows[i][j];
+        }
+    }
+    return array;
+}
+
+// Copy fixed size rows into one contiguous numpy array of shape (rows, N).
+template <typename T, typename U, std::size_t N>
+py::array_t<T> to_numpy(const std::vector<std::array<U, N>>& rows) {
+    py::ssize_t n_rows = rows.size();
+    py::array_t<T> array({n_rows, (py::ssize_t)N});
+    auto buf = array.template mutable_unchecked<2>();
+    for (py::ssize_t i = 0; i < n_rows; i++) {
+        for (std::size_t k = 0; k < N; k++) {
+            buf(i, k) = rows[i][k];
+        }
+    }
+    return array;
+}
+
+// Same as above for rows of fixed size arrays, giving shape (rows, cols, N).
+template <typename T, typename U, std::size_t N>
+py::array_t<T> to_numpy(const std::vector<std::vector<std::array<U, N>>>& rows) {
+    py::ssize_t n_rows = rows.size();
+    py::ssize_t n_cols = rows.empty() ? 0 : rows[0].size();
+    py::array_t<T> array({n_rows, n_cols, (py::ssize_t)N});
+    auto buf = array.template mutable_unchecked<3>();
+    for (py::ssize_t i = 0; i < n_rows; i++) {
+        assertm((py::ssize_t)rows[i].size() == n_cols, "Ragged rows");
+        for (py::ssize_t j = 0; j < n_cols; j++) {
+            for (std::size_t k = 0; k < N; k++) {
+                buf(i, j, k) = rows[i][j][k];
+            }
+        }
+    }
+    return array;
+}
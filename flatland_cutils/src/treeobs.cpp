@@ -27,8 +27,7 @@ void TreeObsForRailEnv::reset() {
     this->rail_loader.reset(this->railenv);
 }
 
-std::pair<std::vector<std::vector<float>>, Forest> TreeObsForRailEnv::get_many(
-    const std::vector<int>& handles) {
+FeatureArrays TreeObsForRailEnv::get_many(const std::vector<int>& handles) {
     /*
     Called whenever an observation has to be computed for the `env` environment,
     for each agent with handle in the `handles` list.
@@ -101,10 +100,16 @@ std::pair<std::vector<std::vector<float>>, Forest> TreeObsForRailEnv::get_many(
         std::get<3>(forest).push_back(edge_order);
     }
 
-    std::pair<std::vector<std::vector<float>>, Forest> feature =
+    auto [agent_attr, parsed_forest] =
         this->feature_parser.parse(this->agents_loader, this->rail_loader, forest);
 
-    return feature;
+    // hand every feature to python as one contiguous array
+    return std::make_pair(
+        to_numpy<float>(agent_attr),
+        std::make_tuple(to_numpy<float>(std::get<0>(parsed_forest)),
+                        to_numpy<int64_t>(std::get<1>(parsed_forest)),
+                        to_numpy<int64_t>(std::get<2>(parsed_forest)),
+                        to_numpy<int64_t>(std::get<3>(parsed_forest))));
 }
 
 
@@ -610,8 +615,7 @@ TreeObsForRailEnv::_explore_branch(int idx_node, const Agent& agent,
 }
 
 std::tuple<std::map<std::string, int>,
-           std::map<std::string, std::vector<double>>,
-           std::vector<std::array<bool, 5>>>
+           std::map<std::string, py::array_t<double>>, py::array_t<bool>>
 TreeObsForRailEnv::get_properties() {
     std::map<std::string, int> env_config;
     std::map<std::string, std::vector<double>> agents_properties;
@@ -636,6 +640,13 @@ TreeObsForRailEnv::get_properties() {
         agents_properties["speed"].push_back((double)ag.speed);
         valid_actions.push_back(ag.valid_actions);
     }
-    return std::make_tuple(env_config, agents_properties, valid_actions);
+
+    // hand every per-agent property to python as one array
+    std::map<std::string, py::array_t<double>> agents_arrays;
+    for (const auto& [key, values] : agents_properties) {
+        agents_arrays[key] = py::array_t<double>(values.size(), values.data());
+    }
+    return std::make_tuple(env_config, agents_arrays,
+                           to_numpy<bool>(valid_actions));
 }
 
@@ -117,6 +117,12 @@ class AgentAttrParser {
     // };
 };
 
+// agent_attr, (forest, adjacency, node_order, edge_order) as numpy arrays
+typedef std::pair<py::array_t<float>,
+                  std::tuple<py::array_t<float>, py::array_t<int64_t>,
+                             py::array_t<int64_t>, py::array_t<int64_t>>>
+    FeatureArrays;
+
 class FeatureParser {
    public:
     AgentAttrParser agent_attr_parser;
@@ -157,12 +163,10 @@ class TreeObsForRailEnv {
     TreeObsForRailEnv(int max_nodes, int _max_pred_depth);
     void set_env(py::object _env);
     void reset();
-    std::pair<std::vector<std::vector<float>>, Forest> get_many(
-        const std::vector<int>& handles);
+    FeatureArrays get_many(const std::vector<int>& handles);
     Tree get(const Agent& agent);
     std::tuple<std::map<std::string, int>,
-               std::map<std::string, std::vector<double>>,
-               std::vector<std::array<bool, 5>>>
+               std::map<std::string, py::array_t<double>>, py::array_t<bool>>
     get_properties();
     std::tuple<Node, std::set<std::pair<Position, int>>, Cell> _explore_branch(
         int idx_parent, const Agent& agent, std::queue<Cell>& waiting_queue);
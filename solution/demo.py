@@ -1,5 +1,4 @@
 from argparse import ArgumentParser
-from time import sleep
 
 from flatland.envs.line_generators import SparseLineGen
 from flatland.envs.malfunction_generators import (
@@ -14,7 +13,7 @@ from flatland_cutils import TreeObsForRailEnv as TreeCutils
 from eval_env import LocalTestEnvWrapper
 from impl_config import FeatureParserConfig as fp
 from plfActor import Actor
-from utils import VideoWriter, debug_show
+from utils import VideoWriter, debug_show, make_render
 
 
 def create_random_env():
@@ -68,16 +67,30 @@ def get_args():
     parser.add_argument(
         "--fps", type=float, default=30, help="frames per second (default 10)"
     )
+    parser.add_argument(
+        "--render-every",
+        type=int,
+        default=1,
+        help="refresh the game window every N steps (default 1)",
+    )
     parser.add_argument(
         "--model",
         default=None,
         help="the checkpoint file of saved model. If not given, a proper model is chosen according to number of agents.",
     )
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        default=False,
+        help="run the dense layers of the model with int8 weights",
+    )
     parser.add_argument(
         "--env", default=None, help="path to saved '*.pkl' file of envs"
     )
     parser.add_argument("--save-video", "-s", default=None, help="path to save video")
     args = parser.parse_args()
+    if args.render_every < 1:
+        parser.error("--render-every must be at least 1")
     return args
 
 
@@ -98,13 +111,16 @@ if __name__ == "__main__":
         model_path = get_model_path(n_agents)
     else:
         model_path = args.model
-    actor = Actor(model_path)
+    actor = Actor(model_path, quantize=args.quantize)
     print(f"Load actor from {model_path}")
 
     # create video writer
     if args.save_video is not None:
         video_writer = VideoWriter(args.save_video, args.fps)
 
+    # decide once how to render, instead of checking the flag every step
+    render = make_render(args.render, args.render_every, 1 / args.fps)
+
     # start step loop
     obs = env_wrapper.reset()
     while True:
@@ -112,9 +128,7 @@ if __name__ == "__main__":
         action = actor.get_actions(obs, va, n_agents)
         obs, all_rewards, done = env_wrapper.step(action)
 
-        if args.render:
-            debug_show(env_wrapper.env)
-            sleep(1 / args.fps)
+        render(env_wrapper.env)
 
         if args.save_video is not None:
             frame = debug_show(env_wrapper.env, mode="rgb_array")
@@ -24,20 +24,14 @@ class TestEnvWrapper:
         obs_list = [self.parse_features(*stdobs)]
         return obs_list
 
-    def action_required(self):
+    def parse_actions(self, actions):
+        agents = self.env.agents
         return {
-            i: self.env.action_required(agent)
-            for i, agent in enumerate(self.env.agents)
+            idx: act
+            for idx, act in actions.items()
+            if self.env.action_required(agents[idx])
         }
 
-    def parse_actions(self, actions):
-        action_required = self.action_required()
-        parsed_action = dict()
-        for idx, act in actions.items():
-            if action_required[idx]:
-                parsed_action[idx] = act
-        return parsed_action
-
     def step(self, actions):
         actions = self.parse_actions(actions)
         feature, reward, done, info = self.remote_client.env_step(actions)
@@ -62,34 +56,32 @@ class TestEnvWrapper:
         self.obs_properties["valid_actions"] = valid_actions
 
     def parse_features(self, feature, obs_properties):
-        def _fill_feature(items: np.ndarray, max):
-            shape = items.shape
-            new_items = np.zeros((max, *shape[1:]))
-            new_items[: shape[0], ...] = items
-            return new_items
-
+        # the feature parser already returns float32 / int64 arrays, which
+        # np.asarray takes as they are instead of copying
         feature_list = {}
-        feature_list["agent_attr"] = np.array(feature[0])
-        feature_list["forest"] = np.array(feature[1][0])
-        feature_list["forest"][feature_list["forest"] == np.inf] = -1
-        feature_list["adjacency"] = np.array(feature[1][1])
-        feature_list["node_order"] = np.array(feature[1][2])
-        feature_list["edge_order"] = np.array(feature[1][3])
+        feature_list["agent_attr"] = np.asarray(feature[0], dtype=np.float32)
+        forest = np.asarray(feature[1][0], dtype=np.float32)
+        # np.where builds a new array, the parser's one is also env.obs_dict
+        feature_list["forest"] = np.where(forest == np.inf, np.float32(-1), forest)
+        feature_list["adjacency"] = np.asarray(feature[1][1], dtype=np.int64)
+        feature_list["node_order"] = np.asarray(feature[1][2], dtype=np.int64)
+        feature_list["edge_order"] = np.asarray(feature[1][3], dtype=np.int64)
         feature_list.update(obs_properties)
         return feature_list
 
     def final_metric(self):
         assert self.env.dones["__all__"]
         env = self.env
+        n_agents = env.get_num_agents()
 
         n_arrival = 0
         for a in env.agents:
             if a.position is None and a.state != TrainState.READY_TO_DEPART:
                 n_arrival += 1
 
-        arrival_ratio = n_arrival / env.get_num_agents()
-        total_reward = sum(list(env.rewards_dict.values()))
-        norm_reward = 1 + total_reward / env._max_episode_steps / env.get_num_agents()
+        arrival_ratio = n_arrival / n_agents
+        total_reward = sum(env.rewards_dict.values())
+        norm_reward = 1 + total_reward / env._max_episode_steps / n_agents
 
         return arrival_ratio, total_reward, norm_reward
 
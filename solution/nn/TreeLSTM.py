@@ -50,11 +50,30 @@ class TreeLSTM(nn.Module):
         h = torch.zeros(batch_size, self.out_features, device=device)
         c = torch.zeros(batch_size, self.out_features, device=device)
 
+        # group node and edge indexes by evaluation order in one pass, instead
+        # of scanning node_order and edge_order with a mask at every iteration
+        n_levels = int(node_order.max()) + 1
+        node_levels = self._group_by_order(node_order, n_levels)
+        edge_levels = self._group_by_order(edge_order, n_levels)
+
         # populate the h and c states respecting computation order
-        for n in range(node_order.max() + 1):
-            self._run_lstm(n, h, c, forest, node_order, adjacency_list, edge_order)
+        for n in range(n_levels):
+            self._run_lstm(
+                n, h, c, forest, node_levels[n], adjacency_list, edge_levels[n]
+            )
         return h
 
+    @staticmethod
+    def _group_by_order(order: torch.Tensor, n_levels: int):
+        """Split the indexes of `order` into one index tensor per evaluation level.
+        Indexes keep their ascending order inside a level, and invalid entries
+        (negative order) are dropped.
+        """
+        sorted_order, perm = torch.sort(order, stable=True)
+        valid = sorted_order >= 0
+        counts = torch.bincount(sorted_order[valid], minlength=n_levels)
+        return torch.split(perm[valid], counts.tolist())
+
     # @torchsnooper.snoop()
     def _run_lstm(
         self,
@@ -62,9 +81,9 @@ class TreeLSTM(nn.Module):
         h: torch.Tensor,
         c: torch.Tensor,
         features: torch.Tensor,
-        node_order: torch.Tensor,
+        node_index: torch.Tensor,
         adjacency_list: torch.Tensor,
-        edge_order: torch.Tensor,
+        edge_index: torch.Tensor,
     ):
         """Helper function to evaluate all tree nodes currently able to be evaluated."""
         # N is the number of nodes in the tree
@@ -74,18 +93,13 @@ class TreeLSTM(nn.Module):
         # F is the number of features in each node
         # M is the number of hidden neurons in the network
 
-        # node_order is a tensor of size N x 1
-        # edge_order is a tensor of size E x 1
+        # node_index is a tensor of size n holding the nodes of the current iteration
+        # edge_index is a tensor of size e holding the edges of the current iteration
         # features is a tensor of size N x F
         # adjacency_list is a tensor of size E x 2
 
-        # node_mask is a tensor of size N x 1
-        node_mask = node_order == iteration
-        # edge_mask is a tensor of size E x 1
-        edge_mask = edge_order == iteration
-
         # x is a tensor of size n x F
-        x = features[node_mask, :]
+        x = features[node_index, :]
 
         # At iteration 0 none of the nodes should have children
         # Otherwise, select the child nodes needed for current iteration
@@ -94,7 +108,7 @@ class TreeLSTM(nn.Module):
             iou = self.W_iou(x)
         else:
             # adjacency_list is a tensor of size e x 2
-            adjacency_list = adjacency_list[edge_mask, :]
+            adjacency_list = adjacency_list[edge_index, :]
 
             # parent_indexes and child_indexes are tensors of size e x 1
             # parent_indexes and child_indexes contain the integer indexes needed to index into
@@ -122,16 +136,16 @@ class TreeLSTM(nn.Module):
             iou = self.W_iou(x) + self.U_iou(child_h_merge)
 
         # i, o and u are tensors of size n x M
-        i, o, u = torch.split(iou, iou.size(1) // 3, dim=1)
-        i = torch.sigmoid(i)
-        o = torch.sigmoid(o)
+        # i and o share a single sigmoid over their contiguous slice of iou
+        io, u = torch.split(iou, [2 * self.out_features, self.out_features], dim=1)
+        i, o = torch.sigmoid(io).chunk(2, dim=1)
         u = torch.tanh(u)
 
         # At iteration 0 none of the nodes should have children
         # Otherwise, calculate the forget states for each parent node and child node
         # and sum over the child memory cell states
         if iteration == 0:
-            c[node_mask, :] = i * u
+            c_node = i * u
         else:
             # f is a tensor of size e x M
             f = self.W_f(features[parent_indexes, :]) + self.U_f(child_h)
@@ -149,6 +163,7 @@ class TreeLSTM(nn.Module):
             fc = fc.unflatten(0, (fc.shape[0] // 3, 3)).flatten(start_dim=1)
             c_reduce = self.W_c(fc)
 
-            c[node_mask, :] = i * u + c_reduce
+            c_node = torch.addcmul(c_reduce, i, u)
 
-        h[node_mask, :] = o * torch.tanh(c[node_mask])
+        c[node_index, :] = c_node
+        h[node_index, :] = o * torch.tanh(c_node)
@@ -85,20 +85,19 @@ class Network(nn.Module):
         ## attention
         att_embedding = self.transformer(embedding)
 
-        worker_action = torch.zeros((batch_size, n_agents, 5), device=device)
-        worker_action[:, :n_agents, :] = self.actor(embedding, att_embedding)
-        critic_value = self.critic(embedding, att_embedding)
+        # both heads read the same features, so concatenate them only once
+        feature = torch.cat([embedding, att_embedding], dim=-1)
+        worker_action = self.actor(feature)
+        critic_value = self.critic(feature)
         return [worker_action], critic_value  # (batch size, 1)
 
-    def actor(self, embedding, att_embedding):
-        worker_action = torch.cat([embedding, att_embedding], dim=-1)
-        worker_action = self.actor_net(worker_action)
+    def actor(self, feature):
+        worker_action = self.actor_net(feature)
         return worker_action
 
     # @torchsnooper.snoop()
-    def critic(self, embedding, att_embedding):
-        output = torch.cat([embedding, att_embedding], dim=-1)
-        critic_value = self.critic_net(output)
+    def critic(self, feature):
+        critic_value = self.critic_net(feature)
         critic_value = critic_value.mean(1).view(-1)
         return critic_value
 
@@ -106,11 +105,11 @@ class Network(nn.Module):
         batch_size, n_agents, num_edges, _ = adjacency.shape
         num_nodes = num_edges + 1
         id_tree = torch.arange(0, batch_size * n_agents, device=_device)
-        id_nodes = id_tree.view(batch_size, n_agents, 1)
-        adjacency[adjacency == -2] = (
-            -batch_size * n_agents * num_nodes
-        )  # node_idx == -2 invalid node
-        adjacency[..., 0] += id_nodes * num_nodes
-        adjacency[..., 1] += id_nodes * num_nodes
-        adjacency[adjacency < 0] = -2
-        return adjacency
+        id_nodes = id_tree.view(batch_size, n_agents, 1, 1)
+        # shift parent and child columns by the node offset of their tree
+        column_mask = torch.tensor([1, 1, 0], device=_device)
+        shifted = adjacency + id_nodes * num_nodes * column_mask
+        # build a new tensor instead of writing into adjacency, which aliases
+        # the observation array
+        invalid = (adjacency == -2) | (shifted < 0)  # node_idx == -2 invalid node
+        return shifted.masked_fill(invalid, -2)
@@ -5,45 +5,73 @@ from nn.net_tree import Network
 
 
 class Actor:
-    def __init__(self, model_path) -> None:
+    def __init__(self, model_path, quantize=False) -> None:
         self.net = Network()
         self.net.load_state_dict(
             torch.load(model_path, map_location=torch.device("cpu"))
         )
         self.net.eval()
+        # the dense sub-networks have fixed shapes, so compile them to frozen
+        # TorchScript; the tree LSTM keeps its data dependent python loop.
+        # With `quantize`, their Linear layers run with int8 weights.
+        for name in ("attr_embedding", "actor_net", "critic_net"):
+            module = getattr(self.net, name)
+            if quantize:
+                module = torch.quantization.quantize_dynamic(
+                    module, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            module = torch.jit.freeze(torch.jit.script(module))
+            setattr(self.net, name, module)
+        # soft sampling always used the first draw after seeding with 42; draw
+        # it once from a private generator instead of reseeding every step
+        self.uniform_sample = np.random.RandomState(42).random_sample()
 
     def get_actions(self, obs_list, valid_actions, n_agents):
         # obs = torch.from_numpy(np.array(obs)).float()
         feature = self.get_feature(obs_list)
 
-        logits = self.net(*feature)[0][0]
-        logits = logits.squeeze().detach().numpy()
-        actions = dict()
-        valid_actions = np.array(valid_actions)
-        for i in range(n_agents):
-            if n_agents == 1:
-                actions[i] = self._choose_action(valid_actions[i, :], logits)
-            else:
-                actions[i] = self._choose_action(valid_actions[i, :], logits[i, :])
-        return actions
+        # skip autograd bookkeeping and version counting on the rollout path
+        with torch.inference_mode():
+            logits = self.net(*feature)[0][0]
+        logits = logits.squeeze().numpy().reshape(n_agents, -1)
+        valid_actions = np.asarray(valid_actions)
+        actions = self._choose_actions(valid_actions, logits)
+        # one bulk conversion to python ints instead of boxing agent by agent
+        return dict(enumerate(actions.tolist()))
+
+    def _choose_actions(self, valid_actions, logits, soft_or_hard_max="soft"):
+        """Choose an action for every agent at once.
+
+        Args:
+            valid_actions (np.ndarray): (n_agents, action_sz) mask of valid actions.
+            logits (np.ndarray): (n_agents, action_sz) policy logits.
+            soft_or_hard_max (str, optional): "soft" samples from the softmax over
+                valid actions, "hard" takes the best valid action. Defaults to "soft".
 
-    def _choose_action(self, valid_actions, logits, soft_or_hard_max="soft"):
-        def _softmax(x):
-            if x.size != 0:
-                e_x = np.exp(x - np.max(x))
-                return e_x / e_x.sum()
-            else:
-                return None
+        Returns:
+            np.ndarray: (n_agents,) chosen actions. Agents without any valid
+                action get action 0.
+        """
+        valid = valid_actions != 0
+        has_valid = valid.any(axis=1)
+        masked_logits = logits.copy()
+        masked_logits[~valid] = -np.inf
+        masked_logits[~has_valid] = 0
 
-        _logits = _softmax(logits[valid_actions != 0])
         if soft_or_hard_max == "soft":
-            if valid_actions.nonzero()[0].size == 0:
-                valid_actions = np.ones((1, 5))
-            np.random.seed(42)
-            action = np.random.choice(valid_actions.nonzero()[0], p=_logits)
+            # softmax over the valid actions of each agent
+            e_x = np.exp(masked_logits - masked_logits.max(axis=1, keepdims=True))
+            probs = e_x / e_x.sum(axis=1, keepdims=True)
+
+            # inverse transform sampling, as np.random.choice does, with the
+            # same uniform sample for every agent
+            cdf = probs.astype(np.float64).cumsum(axis=1)
+            cdf /= cdf[:, -1:]
+            actions = (valid & (cdf > self.uniform_sample)).argmax(axis=1)
         else:
-            action = valid_actions.nonzero()[0][np.argmax(_logits)]
-        return action
+            actions = masked_logits.argmax(axis=1)
+        actions[~has_valid] = 0
+        return actions
 
     def get_feature(self, obs_list):
         agents_attr = obs_list[0]["agent_attr"]
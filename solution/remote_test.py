@@ -1,11 +1,10 @@
 import argparse
 import os
 import traceback
-from time import sleep
 
 from eval_env import TestEnvWrapper
 from plfActor import Actor
-from utils import VideoWriter, debug_show
+from utils import VideoWriter, debug_show, make_render
 
 parser = argparse.ArgumentParser()
 parser.add_argument("--render", "-r", action="store_true", default=False)
@@ -13,18 +12,40 @@ parser.add_argument("--save-videos", "-s", action="store_true")
 parser.add_argument(
     "--fps", type=float, default=30, help="frames per second (default 10)"
 )
+parser.add_argument(
+    "--render-every",
+    type=int,
+    default=1,
+    help="refresh the game window every N steps (default 1)",
+)
+parser.add_argument(
+    "--quantize",
+    action="store_true",
+    default=False,
+    help="run the dense layers of the models with int8 weights",
+)
 parser.add_argument("--tests-folder", default="./debug-environments/")
 parser.add_argument("--policy-folder", default="./policy/")
 
 args = parser.parse_args()
+if args.render_every < 1:
+    parser.error("--render-every must be at least 1")
 
 
 os.environ["AICROWD_TESTS_FOLDER"] = args.tests_folder
 
-actor_50 = Actor(os.sep.join([args.policy_folder, "phase-III-50.pt"]))
-actor_80 = Actor(os.sep.join([args.policy_folder, "phase-III-80.pt"]))
-actor_100 = Actor(os.sep.join([args.policy_folder, "phase-III-100.pt"]))
-actor_200 = Actor(os.sep.join([args.policy_folder, "phase-III-200.pt"]))
+actor_50 = Actor(
+    os.sep.join([args.policy_folder, "phase-III-50.pt"]), quantize=args.quantize
+)
+actor_80 = Actor(
+    os.sep.join([args.policy_folder, "phase-III-80.pt"]), quantize=args.quantize
+)
+actor_100 = Actor(
+    os.sep.join([args.policy_folder, "phase-III-100.pt"]), quantize=args.quantize
+)
+actor_200 = Actor(
+    os.sep.join([args.policy_folder, "phase-III-200.pt"]), quantize=args.quantize
+)
 
 
 def get_actor(n_agents):
@@ -38,6 +59,10 @@ def get_actor(n_agents):
         return actor_200
 
 
+# decide once how to render, instead of checking the flag every step
+render = make_render(args.render, args.render_every, 0.1)
+
+
 railenv = TestEnvWrapper()
 episode = 0
 
@@ -48,7 +73,6 @@ while True:
     # NO WAY TO CHECK service/self.evaluation_done in client
 
     obs = railenv.reset()
-    actor = get_actor(railenv.env.number_of_agents)
     if obs is False:
         # The remote env returns False as the first obs
         # when it is done evaluating all the individual episodes
@@ -67,9 +91,11 @@ while True:
         videofile = os.path.join(dir, f"{level}.mp4")
         video_writer = VideoWriter(videofile, args.fps)
 
+    # the number of agents is fixed for an episode
+    n_agents = railenv.env.number_of_agents
+    actor = get_actor(n_agents)
     while True:
         va = railenv.get_valid_actions()
-        n_agents = railenv.remote_client.env.number_of_agents
         action = actor.get_actions(obs, va, n_agents)
         try:
             obs, all_rewards, done = railenv.step(action)
@@ -77,9 +103,7 @@ while True:
             if args.save_videos:
                 frame = debug_show(railenv.remote_client.env, mode="rgb_array")
                 video_writer.write(frame)
-            if args.render:
-                debug_show(railenv.remote_client.env)
-                sleep(0.1)
+            render(railenv.remote_client.env)
         except:
             traceback.print_exc()
             # print("[ERR] DONE BUT step() CALLED")
@@ -2,7 +2,7 @@ from flatland.envs.rail_env import RailEnv
 from flatland.utils.rendertools import AgentRenderVariant
 
 # from utils import patch_pglgl
-from .patch_pglgl import debug_show
+from .patch_pglgl import debug_show, make_render
 
 from .env_utils import get_possible_actions
 
@@ -11,6 +11,7 @@ from .video_writer import VideoWriter
 __all__ = [
     "get_possible_actions",
     "debug_show",
+    "make_render",
     "VideoWriter",
     # "patch_pglgl",
 ]
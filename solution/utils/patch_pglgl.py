@@ -2,6 +2,7 @@ import os
 import shutil
 from itertools import cycle
 from pathlib import Path
+from time import sleep
 
 import numpy as np
 import pyglet as pgl
@@ -93,6 +94,35 @@ def debug_show(env: RailEnv, mode="human", save_images_path=None) -> None:
         raise ValueError("mode must be 'human' or 'rgb_array'")
 
 
+def make_render(enabled: bool, render_every: int = 1, delay: float = 0.0):
+    """Build the per-step render callback of a step loop.
+
+    Args:
+        enabled (bool): whether to show the game window at all.
+            If False, the returned callback does nothing.
+
+        render_every (int, optional):
+            refresh the window every `render_every` steps and on the
+            last step of the episode. Defaults to 1.
+
+        delay (float, optional):
+            seconds to sleep after each refresh. Defaults to 0.0.
+
+    Returns:
+        Callable[[RailEnv], None]: call it with the env after every step.
+    """
+    if not enabled:
+        return lambda env: None
+
+    def render(env: RailEnv) -> None:
+        # always draw the last step, so the window ends on the final frame
+        if env._elapsed_steps % render_every == 0 or env.dones["__all__"]:
+            debug_show(env)
+            sleep(delay)
+
+    return render
+
+
 def get_window(width, height):
     if reuse_window:
         global _window